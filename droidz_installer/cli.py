@@ -7,8 +7,10 @@ import sys
 from pathlib import Path
 from typing import Sequence
 
+from . import __version__
 from .core import InstallOptions, install, list_platforms
 from .exceptions import InstallerError
+from .upgrade import find_installations, upgrade_installations
 
 DEFAULT_MANIFEST = Path(__file__).resolve().parent / "manifests" / "platforms.json"
 DEFAULT_PAYLOADS = Path(__file__).resolve().parent / "payloads"
@@ -18,6 +20,11 @@ def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="droidz-install",
         description="Install Droidz instructions into your preferred AI coding tool.",
+        epilog=(
+            "To upgrade every --install-to-project install under a directory tree, run "
+            "'droidz-install upgrade --root DIR' (see 'droidz-install upgrade --help'). "
+            "'upgrade' must be the first argument; options for it go after it."
+        ),
     )
     parser.add_argument(
         "-p",
@@ -85,7 +92,63 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def build_upgrade_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="droidz-install upgrade",
+        description=(
+            "Find every project installed with --install-to-project under a directory "
+            "tree and upgrade the ones that are not on the current version."
+        ),
+    )
+    parser.add_argument(
+        "--root",
+        required=True,
+        type=Path,
+        help="Directory tree to scan for project installs.",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help=(
+            "Instruction profile to reinstall with. Defaults to the profile each project "
+            "was installed with ('default' for installs made before profiles were recorded)."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker threads for scanning and upgrading (defaults to Python's choice).",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST,
+        type=Path,
+        help="Path to the installer manifest (JSON).",
+    )
+    parser.add_argument(
+        "--payload-source",
+        default=DEFAULT_PAYLOADS,
+        type=Path,
+        help="Directory that contains platform payloads.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Preview actions without writing.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite existing instructions instead of backing them up.",
+    )
+    parser.add_argument("--quiet", action="store_true", help="Suppress progress output.")
+    return parser
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "upgrade":
+        return _upgrade_main(argv[1:])
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
@@ -129,5 +192,61 @@ def main(argv: Sequence[str] | None = None) -> int:
     return 0
 
 
+def _upgrade_main(argv: Sequence[str]) -> int:
+    parser = build_upgrade_parser()
+    args = parser.parse_args(argv)
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
+    manifest_path = Path(args.manifest).expanduser()
+    payload_source = Path(args.payload_source).expanduser()
+
+    try:
+        projects = find_installations(
+            args.root,
+            manifest_path,
+            payload_source,
+            profile=args.profile or "default",
+            workers=args.jobs,
+            on_error=_report_scan_error,
+        )
+    except InstallerError as exc:
+        parser.error(str(exc))
+
+    stale = [project for project in projects if not project.is_current(__version__)]
+    upgrades = upgrade_installations(
+        stale,
+        profile=args.profile,
+        manifest_path=manifest_path,
+        payload_source=payload_source,
+        force=args.force,
+        dry_run=args.dry_run,
+        workers=args.jobs,
+    )
+
+    failed = [upgrade for upgrade in upgrades if upgrade.error]
+    action = "would upgrade" if args.dry_run else "upgraded"
+    for upgrade in upgrades:
+        if upgrade.error:
+            print(f"failed: {upgrade.project.root}: {upgrade.error}", file=sys.stderr)
+        elif not args.quiet:
+            platforms = ", ".join(sorted(upgrade.project.platforms))
+            print(f"{action}: {upgrade.project.root} [{platforms}]")
+
+    if not args.quiet:
+        outcome = "stale" if args.dry_run else f"upgraded to {__version__}"
+        print(
+            f"\n{len(projects)} install(s) found: {len(projects) - len(stale)} current, "
+            f"{len(stale) - len(failed)} {outcome}, {len(failed)} failed."
+        )
+
+    return 1 if failed else 0
+
+
+def _report_scan_error(error: OSError) -> None:
+    print(f"warning: could not scan {error.filename}: {error.strerror}", file=sys.stderr)
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
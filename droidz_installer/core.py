@@ -10,6 +10,10 @@ from typing import Dict, Iterable, List, Optional
 from . import fs, payloads
 from .exceptions import InstallerError
 
+# Records which platforms (and at which version) were installed into a project.
+# Lives beside ``droidz/standards`` so ``--force`` reinstalls don't wipe it.
+PROJECT_STAMP = Path("droidz") / ".droidz-install.json"
+
 
 @dataclass
 class InstallTarget:
@@ -75,6 +79,15 @@ class InstallOptions:
     manifest_path: Path
     payload_source: Path
     verbose: bool
+    project_root: Optional[Path] = None
+
+
+@dataclass
+class ProjectStamp:
+    """Platforms, versions, and profile recorded by a project install."""
+
+    profile: str
+    platforms: Dict[str, str]
 
 
 @dataclass
@@ -110,6 +123,13 @@ def install(options: InstallOptions) -> List[InstallResult]:
     requested = _determine_platforms(options.platforms, manifest)
     results: List[InstallResult] = []
 
+    # Track which destinations have been prepared to avoid removing files
+    # when multiple targets (or platforms) install to the same location
+    prepared_destinations: Dict[Path, Optional[Path]] = {}
+
+    # Resolve the project directory ONCE before any destination preparation
+    current_dir = _resolve_project_root(options)
+
     for platform_name in requested:
         spec = PlatformSpec.from_dict(platform_name, manifest["platforms"][platform_name])
 
@@ -117,20 +137,6 @@ def install(options: InstallOptions) -> List[InstallResult]:
             print(f"\nInstalling {spec.label} (full framework)")
             print(f"  {len(spec.install_targets)} target(s) to install")
 
-        # Resolve current directory ONCE before any destination preparation
-        # to avoid issues if force=True deletes the cwd
-        try:
-            current_dir = Path.cwd().resolve()
-        except (FileNotFoundError, OSError):
-            # If cwd was deleted by a previous operation, try to recover
-            import os
-            # This will raise if we truly can't determine where we are
-            current_dir = Path(os.environ.get('PWD', '.')).resolve()
-
-        # Track which destinations have been prepared to avoid removing files
-        # when multiple targets install to the same location
-        prepared_destinations: Dict[Path, Optional[Path]] = {}
-
         for idx, target in enumerate(spec.install_targets, 1):
             # Resolve destination path
             if options.install_to_project:
@@ -140,19 +146,7 @@ def install(options: InstallOptions) -> List[InstallResult]:
                     destination = current_dir / "droidz" / "standards"
                 else:
                     # Agent-specific goes to .factory/droids/, .claude/, etc.
-                    dest_path = Path(target.destination)
-                    # Find the part that starts with . or is a known dir
-                    parts = dest_path.parts
-                    # Get everything from the last dir that starts with . onwards
-                    agent_dir = None
-                    for i, part in enumerate(parts):
-                        if part.startswith('.'):
-                            agent_dir = Path(*parts[i:])
-                            break
-                    if not agent_dir:
-                        # Fallback: use the last part with a dot prefix
-                        agent_dir = Path(f".{parts[-1]}")
-                    destination = current_dir / agent_dir
+                    destination = current_dir / project_agent_dir(target)
             elif options.destination_override:
                 # Override applies to agent-specific targets only, not shared
                 if target.type == "agent":
@@ -208,9 +202,73 @@ def install(options: InstallOptions) -> List[InstallResult]:
                 )
             )
 
+    if options.install_to_project and not options.dry_run:
+        _write_project_stamp(current_dir, requested, options.profile)
+
     return results
 
 
+def project_agent_dir(target: InstallTarget) -> Path:
+    """Return the project-relative directory an agent target installs into."""
+
+    parts = Path(target.destination).parts
+    # Get everything from the first dir that starts with . onwards
+    for i, part in enumerate(parts):
+        if part.startswith("."):
+            return Path(*parts[i:])
+    # Fallback: use the last part with a dot prefix
+    return Path(f".{parts[-1]}")
+
+
+def read_project_stamp(project_dir: Path) -> Optional[ProjectStamp]:
+    """Return the install stamp recorded in a project, if any."""
+
+    try:
+        with (project_dir / PROJECT_STAMP).open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+    platforms = data.get("platforms") if isinstance(data, dict) else None
+    if not isinstance(platforms, dict) or not platforms:
+        return None
+    return ProjectStamp(
+        profile=str(data.get("profile") or "default"),
+        platforms={str(name): str(version) for name, version in platforms.items()},
+    )
+
+
+def _write_project_stamp(project_dir: Path, platforms: Iterable[str], profile: str) -> None:
+    from . import __version__
+
+    existing = read_project_stamp(project_dir)
+    recorded = dict(existing.platforms) if existing else {}
+    for name in platforms:
+        recorded[name] = __version__
+
+    stamp = project_dir / PROJECT_STAMP
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.write_text(
+        json.dumps({"profile": profile, "platforms": dict(sorted(recorded.items()))}, indent=2)
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def _resolve_project_root(options: InstallOptions) -> Path:
+    if options.project_root is not None:
+        return fs.expand_path(options.project_root)
+
+    # force=True may have deleted the cwd during an earlier run
+    try:
+        return Path.cwd().resolve()
+    except (FileNotFoundError, OSError):
+        # If cwd was deleted by a previous operation, try to recover
+        import os
+        # This will raise if we truly can't determine where we are
+        return Path(os.environ.get('PWD', '.')).resolve()
+
+
 def _determine_platforms(requested: Iterable[str], manifest: Dict) -> List[str]:
     available = list(manifest["platforms"].keys())
 
@@ -232,11 +290,15 @@ def _determine_platforms(requested: Iterable[str], manifest: Dict) -> List[str]:
 
 
 __all__ = [
+    "PROJECT_STAMP",
     "InstallOptions",
     "InstallResult",
     "InstallTarget",
     "PlatformSpec",
+    "ProjectStamp",
     "install",
     "list_platforms",
     "load_manifest",
+    "project_agent_dir",
+    "read_project_stamp",
 ]
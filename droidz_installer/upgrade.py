@@ -0,0 +1,268 @@
+"""Discovery and bulk upgrade of project installs under a directory tree."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from . import fs, payloads
+from .core import (
+    InstallOptions,
+    InstallResult,
+    PlatformSpec,
+    install,
+    load_manifest,
+    project_agent_dir,
+    read_project_stamp,
+)
+from .exceptions import InstallerError
+
+# Directories that never contain project installs and are expensive to walk.
+PRUNED_DIRS = frozenset({".git", "node_modules"})
+
+ScanErrorHandler = Callable[[OSError], None]
+
+
+@dataclass
+class InstalledProject:
+    """A project containing a ``--install-to-project`` layout."""
+
+    root: Path
+    platforms: Dict[str, Optional[str]]
+    profile: str = "default"
+    # Unstamped agent dirs whose contents match more than one platform's payload
+    ambiguous: List[Path] = field(default_factory=list)
+
+    def is_current(self, version: str) -> bool:
+        if self.ambiguous:
+            return False
+        return all(installed == version for installed in self.platforms.values())
+
+
+@dataclass
+class UpgradeResult:
+    project: InstalledProject
+    results: List[InstallResult]
+    error: Optional[str]
+
+
+def find_installations(
+    root: Path,
+    manifest_path: Path,
+    payload_source: Path,
+    *,
+    profile: str = "default",
+    workers: Optional[int] = None,
+    on_error: Optional[ScanErrorHandler] = None,
+) -> List[InstalledProject]:
+    """Return every project install found beneath root, sorted by path.
+
+    Installs without a stamp only count an agent directory as installed when it
+    holds every top-level entry of that platform's payload for ``profile``; they
+    are reported with that profile.
+
+    Directories that can't be read are skipped; like ``os.walk``, ``on_error`` is
+    called with the ``OSError`` for each one.
+    """
+
+    root = fs.expand_path(root)
+    if not root.is_dir():
+        raise InstallerError(f"Scan root '{root}' is not a directory.")
+
+    agent_dirs = _project_agent_dirs(load_manifest(manifest_path))
+    payload_entries = _payload_entries(agent_dirs, payload_source, profile)
+    projects: List[InstalledProject] = []
+
+    # Walk the tree one level at a time, scanning each level's directories in parallel
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = [root]
+        while pending:
+            next_level: List[Path] = []
+            scans = executor.map(
+                lambda path: _scan_directory(path, agent_dirs, payload_entries, profile),
+                pending,
+            )
+            for project, children, errors in scans:
+                if on_error is not None:
+                    for error in errors:
+                        on_error(error)
+                if project is not None:
+                    projects.append(project)
+                next_level.extend(children)
+            pending = next_level
+
+    return sorted(projects, key=lambda project: project.root)
+
+
+def upgrade_installations(
+    projects: List[InstalledProject],
+    *,
+    profile: Optional[str],
+    manifest_path: Path,
+    payload_source: Path,
+    force: bool,
+    dry_run: bool,
+    workers: Optional[int] = None,
+) -> List[UpgradeResult]:
+    """Reinstall each project's platforms concurrently, collecting per-project errors.
+
+    Each project keeps the profile it was installed with unless ``profile`` overrides it.
+    """
+
+    def _upgrade(project: InstalledProject) -> UpgradeResult:
+        options = InstallOptions(
+            platforms=sorted(project.platforms),
+            profile=profile or project.profile,
+            destination_override=None,
+            use_platform_defaults=False,
+            install_to_project=True,
+            dry_run=dry_run,
+            force=force,
+            manifest_path=manifest_path,
+            payload_source=payload_source,
+            verbose=False,
+            project_root=project.root,
+        )
+        if project.ambiguous:
+            dirs = ", ".join(str(path) for path in project.ambiguous)
+            return UpgradeResult(
+                project=project, results=[], error=f"Cannot tell which platform installed {dirs}."
+            )
+        try:
+            return UpgradeResult(project=project, results=install(options), error=None)
+        except (InstallerError, OSError) as exc:
+            return UpgradeResult(project=project, results=[], error=str(exc))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_upgrade, projects))
+
+
+def _project_agent_dirs(manifest: Dict) -> Dict[Path, List[Tuple[str, str]]]:
+    # Maps each project agent dir to the (platform, payload source) pairs installing there
+    agent_dirs: Dict[Path, List[Tuple[str, str]]] = {}
+    for name, cfg in manifest["platforms"].items():
+        for target in PlatformSpec.from_dict(name, cfg).install_targets:
+            if target.type == "agent":
+                agent_dirs.setdefault(project_agent_dir(target), []).append(
+                    (name, target.source)
+                )
+    return agent_dirs
+
+
+def _payload_entries(
+    agent_dirs: Dict[Path, List[Tuple[str, str]]], payload_source: Path, profile: str
+) -> Dict[str, FrozenSet[str]]:
+    entries: Dict[str, FrozenSet[str]] = {}
+    for platforms in agent_dirs.values():
+        for _, source in platforms:
+            if source in entries:
+                continue
+            try:
+                payload_dir = payloads.resolve_payload_dir(payload_source, source, profile)
+                entries[source] = frozenset(os.listdir(payload_dir))
+            except (InstallerError, OSError):
+                entries[source] = frozenset()
+    return entries
+
+
+def _has_payload(directory: Path, entries: FrozenSet[str]) -> bool:
+    if not entries:
+        return False
+    try:
+        return entries <= set(os.listdir(directory))
+    except OSError:
+        return False
+
+
+def _scan_directory(
+    path: Path,
+    agent_dirs: Dict[Path, List[Tuple[str, str]]],
+    payload_entries: Dict[str, FrozenSet[str]],
+    profile: str,
+) -> Tuple[Optional[InstalledProject], List[Path], List[OSError]]:
+    children: Dict[str, Path] = {}
+    errors: List[OSError] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name in PRUNED_DIRS:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        children[entry.name] = Path(entry.path)
+                except OSError as exc:
+                    errors.append(exc)
+    except OSError as exc:
+        errors.append(exc)
+        return None, [], errors
+
+    if "droidz" not in children or not (path / "droidz" / "standards").is_dir():
+        return None, list(children.values()), errors
+
+    stamp = read_project_stamp(path)
+    platforms: Dict[str, Optional[str]]
+    ambiguous: List[Path] = []
+    if stamp is not None:
+        profile = stamp.profile
+        # The stamp is authoritative: unlisted agent dirs belong to the user, not droidz
+        owned = {
+            name: agent_dir
+            for agent_dir, platforms_here in agent_dirs.items()
+            for name, _ in platforms_here
+        }
+        platforms = {
+            name: version for name, version in stamp.platforms.items() if name in owned
+        }
+        installed = {owned[name] for name in platforms}
+    else:
+        # Older installs have no stamp; only trust agent dirs holding a droidz payload.
+        # Several platforms can share a dir (cursor/vscode), so match on payload source
+        # and refuse to guess when more than one source fits.
+        platforms = {}
+        installed = set()
+        for agent_dir, platforms_here in agent_dirs.items():
+            if agent_dir.parts[0] not in children:
+                continue
+            by_source: Dict[str, str] = {}
+            for name, source in platforms_here:
+                by_source.setdefault(source, name)
+            matches = [
+                name
+                for source, name in by_source.items()
+                if _has_payload(path / agent_dir, payload_entries[source])
+            ]
+            if len(matches) == 1:
+                platforms[matches[0]] = None
+                installed.add(agent_dir)
+            elif matches:
+                ambiguous.append(path / agent_dir)
+                installed.add(agent_dir)
+
+    if not platforms and not ambiguous:
+        return None, list(children.values()), errors
+
+    # Don't descend into the installed payloads themselves or their upgrade backups
+    skipped = {"droidz"} | {agent_dir.parts[0] for agent_dir in installed}
+    backups = tuple(f"{name}.backup-" for name in skipped)
+    remaining = [
+        child
+        for name, child in children.items()
+        if name not in skipped and not name.startswith(backups)
+    ]
+    project = InstalledProject(
+        root=path, platforms=platforms, profile=profile, ambiguous=ambiguous
+    )
+    return project, remaining, errors
+
+
+__all__ = [
+    "InstalledProject",
+    "PRUNED_DIRS",
+    "ScanErrorHandler",
+    "UpgradeResult",
+    "find_installations",
+    "upgrade_installations",
+]
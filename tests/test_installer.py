@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
-from droidz_installer.core import InstallOptions, install, list_platforms
+from droidz_installer import __version__
+from droidz_installer.cli import DEFAULT_MANIFEST, DEFAULT_PAYLOADS, main
+from droidz_installer.core import PROJECT_STAMP, InstallOptions, install, list_platforms
+from droidz_installer.upgrade import find_installations, upgrade_installations
 
 
 def _write_manifest(base: Path) -> Path:
@@ -38,6 +42,18 @@ def _write_manifest(base: Path) -> Path:
     return manifest_path
 
 
+def _add_platform(manifest_path: Path, name: str) -> Path:
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["platforms"][name] = {
+        "install_targets": [
+            {"type": "shared", "source": "shared", "destination": "~/.droidz"},
+            {"type": "agent", "source": name, "destination": f"~/.{name}"},
+        ]
+    }
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    return manifest_path
+
+
 def _write_payload(base: Path) -> Path:
     # Create shared payload
     shared_root = base / "shared" / "default"
@@ -53,6 +69,14 @@ def _write_payload(base: Path) -> Path:
     return base
 
 
+def _write_unstamped_install(project: Path) -> Path:
+    # Mirrors a demo project install made before install stamps existed
+    (project / "droidz" / "standards").mkdir(parents=True)
+    (project / ".demo" / "scripts").mkdir(parents=True)
+    (project / ".demo" / "note.txt").write_text("demo instructions", encoding="utf-8")
+    return project
+
+
 def test_install_copies_payload_and_creates_backup(tmp_path: Path) -> None:
     manifest_path = _write_manifest(tmp_path)
     payload_source = _write_payload(tmp_path / "payloads")
@@ -138,6 +162,42 @@ def test_install_to_project_installs_everything_to_cwd(tmp_path: Path, monkeypat
     # Verify correct destinations
     assert results[0].destination == project_dir / "droidz" / "standards"  # Shared
     assert results[1].destination == project_dir / ".demo"  # Agent
+    # Installed platforms and version are recorded for later upgrades
+    stamp = json.loads((project_dir / PROJECT_STAMP).read_text(encoding="utf-8"))
+    assert stamp == {"profile": "default", "platforms": {"demo": __version__}}
+
+
+def test_install_to_project_backs_up_shared_once_per_install(tmp_path: Path) -> None:
+    manifest_path = _add_platform(_write_manifest(tmp_path), "other")
+    payload_source = _write_payload(tmp_path / "payloads")
+    (payload_source / "other" / "default").mkdir(parents=True)
+    (payload_source / "other" / "default" / "other.txt").write_text("other", encoding="utf-8")
+    project_dir = tmp_path / "project"
+    (project_dir / "droidz" / "standards").mkdir(parents=True)
+    (project_dir / "droidz" / "standards" / "old.txt").write_text("old", encoding="utf-8")
+
+    options = InstallOptions(
+        platforms=["demo", "other"],
+        profile="default",
+        destination_override=None,
+        use_platform_defaults=False,
+        install_to_project=True,
+        dry_run=False,
+        force=False,
+        manifest_path=manifest_path,
+        payload_source=payload_source,
+        verbose=False,
+        project_root=project_dir,
+    )
+
+    install(options)
+
+    backups = list((project_dir / "droidz").glob("standards.backup-*"))
+    assert len(backups) == 1
+    assert [item.name for item in backups[0].iterdir()] == ["old.txt"]
+    assert (project_dir / "droidz" / "standards" / "framework.txt").exists()
+    assert (project_dir / ".demo" / "note.txt").exists()
+    assert (project_dir / ".other" / "other.txt").exists()
 
 
 def test_list_platforms_reads_manifest(tmp_path: Path) -> None:
@@ -147,3 +207,229 @@ def test_list_platforms_reads_manifest(tmp_path: Path) -> None:
     assert len(specs[0].install_targets) == 2
     assert specs[0].install_targets[0].type == "shared"
     assert specs[0].install_targets[1].type == "agent"
+
+
+def test_find_installations_detects_projects_and_prunes(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    payload_source = _write_payload(tmp_path / "payloads")
+    root = tmp_path / "workspace"
+
+    stale = root / "team" / "stale"
+    _write_unstamped_install(stale)
+
+    current = root / "current"
+    (current / "droidz" / "standards").mkdir(parents=True)
+    (current / ".demo").mkdir()
+    (current / PROJECT_STAMP).write_text(
+        json.dumps({"platforms": {"demo": __version__}}), encoding="utf-8"
+    )
+
+    # Installs under .git/node_modules are never visited
+    for pruned in (root / "node_modules" / "pkg", root / "repo" / ".git" / "x"):
+        _write_unstamped_install(pruned)
+
+    # Backups left by earlier upgrades are not walked
+    nested = stale / ".demo.backup-20250101-000000" / "nested"
+    _write_unstamped_install(nested)
+
+    # A standards directory without any agent directory is not an install
+    (root / "bare" / "droidz" / "standards").mkdir(parents=True)
+
+    projects = find_installations(root, manifest_path, payload_source, workers=4)
+
+    assert [project.root for project in projects] == [current.resolve(), stale.resolve()]
+    assert projects[0].platforms == {"demo": __version__}
+    assert projects[0].is_current(__version__)
+    assert projects[1].platforms == {"demo": None}
+    assert not projects[1].is_current(__version__)
+
+
+def test_upgrade_installations_reinstalls_stale_projects(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    payload_source = _write_payload(tmp_path / "payloads")
+    root = tmp_path / "workspace"
+    for name in ("one", "two"):
+        _write_unstamped_install(root / name)
+
+    projects = find_installations(root, manifest_path, payload_source)
+    upgrades = upgrade_installations(
+        projects,
+        profile="default",
+        manifest_path=manifest_path,
+        payload_source=payload_source,
+        force=True,
+        dry_run=False,
+        workers=2,
+    )
+
+    assert [upgrade.error for upgrade in upgrades] == [None, None]
+    for upgrade in upgrades:
+        assert (upgrade.project.root / ".demo" / "note.txt").exists()
+        assert (upgrade.project.root / "droidz" / "standards" / "framework.txt").exists()
+    rescanned = find_installations(root, manifest_path, payload_source)
+    assert all(project.is_current(__version__) for project in rescanned)
+
+
+def test_upgrade_installations_keeps_recorded_profile(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    payload_source = _write_payload(tmp_path / "payloads")
+    (payload_source / "demo" / "team").mkdir()
+    (payload_source / "demo" / "team" / "team.txt").write_text("team", encoding="utf-8")
+    project = tmp_path / "workspace" / "project"
+    (project / "droidz" / "standards").mkdir(parents=True)
+    (project / ".demo").mkdir()
+    (project / PROJECT_STAMP).write_text(
+        json.dumps({"profile": "team", "platforms": {"demo": "0.0.0"}}), encoding="utf-8"
+    )
+
+    projects = find_installations(tmp_path / "workspace", manifest_path, payload_source)
+    assert projects[0].profile == "team"
+
+    upgrade_installations(
+        projects,
+        profile=None,
+        manifest_path=manifest_path,
+        payload_source=payload_source,
+        force=True,
+        dry_run=False,
+    )
+
+    assert (project / ".demo" / "team.txt").exists()
+    stamp = json.loads((project / PROJECT_STAMP).read_text(encoding="utf-8"))
+    assert stamp == {"profile": "team", "platforms": {"demo": __version__}}
+
+
+def test_find_installations_trusts_stamp_over_agent_dirs(tmp_path: Path) -> None:
+    manifest_path = _add_platform(_write_manifest(tmp_path), "other")
+
+    project = tmp_path / "workspace" / "project"
+    (project / "droidz" / "standards").mkdir(parents=True)
+    (project / ".demo").mkdir()
+    (project / PROJECT_STAMP).write_text(
+        json.dumps({"platforms": {"demo": __version__}}), encoding="utf-8"
+    )
+    # A user-owned agent directory the stamp doesn't list
+    (project / ".other").mkdir()
+    (project / ".other" / "settings.json").write_text("{}", encoding="utf-8")
+
+    payload_source = _write_payload(tmp_path / "payloads")
+    projects = find_installations(tmp_path / "workspace", manifest_path, payload_source)
+
+    assert len(projects) == 1
+    assert projects[0].platforms == {"demo": __version__}
+    assert projects[0].is_current(__version__)
+    assert (project / ".other" / "settings.json").exists()
+
+
+def test_unstamped_install_ignores_user_agent_dirs(tmp_path: Path) -> None:
+    project = tmp_path / "workspace" / "project"
+    (project / "droidz" / "standards").mkdir(parents=True)
+    for entry in ("commands", "droids", "skills"):
+        (project / ".factory" / entry).mkdir(parents=True)
+    # The user's own Claude settings, not a droidz payload
+    (project / ".claude").mkdir()
+    (project / ".claude" / "settings.json").write_text("{}", encoding="utf-8")
+
+    projects = find_installations(tmp_path / "workspace", DEFAULT_MANIFEST, DEFAULT_PAYLOADS)
+
+    assert len(projects) == 1
+    assert projects[0].platforms == {"factory": None}
+
+    upgrade_installations(
+        projects,
+        profile="default",
+        manifest_path=DEFAULT_MANIFEST,
+        payload_source=DEFAULT_PAYLOADS,
+        force=True,
+        dry_run=False,
+    )
+
+    assert sorted(item.name for item in (project / ".claude").iterdir()) == ["settings.json"]
+    assert not list(project.glob(".claude.backup-*"))
+
+
+def test_unstamped_install_tells_shared_agent_dirs_apart(tmp_path: Path) -> None:
+    # cursor and vscode both install into .droidz with different payloads
+    root = tmp_path / "workspace"
+    vscode = root / "vscode"
+    (vscode / "droidz" / "standards").mkdir(parents=True)
+    (vscode / ".droidz" / "snippets").mkdir(parents=True)
+    both = root / "both"
+    (both / "droidz" / "standards").mkdir(parents=True)
+    (both / ".droidz" / "snippets").mkdir(parents=True)
+    (both / ".droidz" / "workflows").mkdir(parents=True)
+
+    projects = find_installations(root, DEFAULT_MANIFEST, DEFAULT_PAYLOADS)
+
+    assert [project.root for project in projects] == [both.resolve(), vscode.resolve()]
+    assert projects[1].platforms == {"vscode": None}
+    assert projects[0].platforms == {}
+    assert projects[0].ambiguous == [both.resolve() / ".droidz"]
+    assert not projects[0].is_current(__version__)
+
+    upgrades = upgrade_installations(
+        projects[:1],
+        profile="default",
+        manifest_path=DEFAULT_MANIFEST,
+        payload_source=DEFAULT_PAYLOADS,
+        force=True,
+        dry_run=False,
+    )
+
+    assert upgrades[0].error is not None
+    assert not (both / PROJECT_STAMP).exists()
+
+
+def test_find_installations_reports_unreadable_directories(tmp_path: Path, monkeypatch) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    root = tmp_path / "workspace"
+    locked = root / "locked"
+    locked.mkdir(parents=True)
+
+    real_scandir = os.scandir
+
+    def _scandir(path):
+        if Path(path) == locked:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    errors: list[OSError] = []
+
+    payload_source = tmp_path / "payloads"
+    assert find_installations(root, manifest_path, payload_source, on_error=errors.append) == []
+    assert [error.filename for error in errors] == [str(locked)]
+
+
+def test_main_dispatches_upgrade_subcommand(tmp_path: Path, capsys) -> None:
+    manifest_path = _add_platform(_write_manifest(tmp_path), "other")
+    payload_source = _write_payload(tmp_path / "payloads")
+    root = tmp_path / "workspace"
+    _write_unstamped_install(root / "ok")
+    args = [
+        "upgrade",
+        "--root",
+        str(root),
+        "--manifest",
+        str(manifest_path),
+        "--payload-source",
+        str(payload_source),
+        "--force",
+    ]
+
+    assert main(args) == 0
+    assert (root / "ok" / ".demo" / "note.txt").exists()
+    assert "0 current, 1 upgraded" in capsys.readouterr().out
+
+    # No payload exists for 'other', so upgrading this project fails
+    broken = root / "broken"
+    (broken / "droidz" / "standards").mkdir(parents=True)
+    (broken / ".other").mkdir()
+    (broken / PROJECT_STAMP).write_text(
+        json.dumps({"platforms": {"other": "0.0.0"}}), encoding="utf-8"
+    )
+
+    assert main(args) == 1
+    captured = capsys.readouterr()
+    assert f"failed: {(root / 'broken').resolve()}" in captured.err
+    assert "1 failed" in captured.out